@@ -43,10 +43,18 @@ class LDAPError(Exception):
 
     :ivar cause: backend exception object, if applicable
     '''
+    __slots__ = ('cause',)
+
     def __init__(self, message, cause=None):
         super(LDAPError, self).__init__(message)
         self.cause = cause
 
+    def __reduce__(self):
+        # cause lives in a slot, which Exception's default pickling misses;
+        # keep any instance __dict__ (e.g. __notes__) like it does, though
+        return (self.__class__, (self.args[0], self.cause),
+                getattr(self, '__dict__', None) or None)
+
 
 def _convert_exception(e):
     '''Convert an ldap backend exception to an LDAPError and raise it.'''
@@ -24,6 +24,8 @@ Rob Speer's changes are as follows:
 from __future__ import absolute_import, unicode_literals, print_function
 import collections
 
+from salt.ext import six
+
 SLICE_ALL = slice(None)
 __version__ = '2.0.1'
 
@@ -195,6 +197,11 @@ class OrderedSet(collections.MutableSet):
     def __eq__(self, other):
         if isinstance(other, OrderedSet):
             return len(self) == len(other) and self.items == other.items
+        if isinstance(other, (set, frozenset)):
+            # Sets can't hold duplicates, so compare against our keys view:
+            # it checks the sizes first and then membership one item at a
+            # time, without building a temporary set.
+            return six.viewkeys(self.map) == other
         try:
             other_as_set = set(other)
         except TypeError:
@@ -202,3 +209,6 @@ class OrderedSet(collections.MutableSet):
             return False
         else:
             return set(self) == other_as_set
+
+    # Mutable, and equality is value based
+    __hash__ = None
@@ -8,12 +8,23 @@
 #         class has no __init__ method
 
 from __future__ import absolute_import, print_function, unicode_literals
+import warnings
+
 try:
     from yaml import CDumper as Dumper
     from yaml import CSafeDumper as SafeDumper
+    HAS_LIBYAML = True
 except ImportError:
+    # PyYAML was built without libyaml support, the pure-Python emitter
+    # is considerably slower, so make this visible instead of failing over
+    # silently.
+    warnings.warn(
+        'libyaml CDumper unavailable; YAML dumps will be 5-10x slower',
+        RuntimeWarning
+    )
     from yaml import Dumper
     from yaml import SafeDumper
+    HAS_LIBYAML = False
 
 import yaml  # pylint: disable=blacklisted-import
 import collections
@@ -63,7 +74,7 @@ class IndentedSafeOrderedDumper(IndentMixin, SafeOrderedDumper):
 
 
 def represent_ordereddict(dumper, data):
-    return dumper.represent_dict(list(data.items()))
+    return dumper.represent_mapping('tag:yaml.org,2002:map', data.items())
 
 
 OrderedDumper.add_representer(OrderedDict, represent_ordereddict)
@@ -78,44 +89,40 @@ SafeOrderedDumper.add_representer(
     yaml.representer.SafeRepresenter.represent_dict
 )
 
-OrderedDumper.add_representer(
-    'tag:yaml.org,2002:timestamp',
-    OrderedDumper.represent_scalar)
-SafeOrderedDumper.add_representer(
-    'tag:yaml.org,2002:timestamp',
-    SafeOrderedDumper.represent_scalar)
-
 if HAS_IOFLO:
     OrderedDumper.add_representer(odict, represent_ordereddict)
     SafeOrderedDumper.add_representer(odict, represent_ordereddict)
 
 
+_DUMPERS = {
+    'OrderedDumper': OrderedDumper,
+    'SafeOrderedDumper': SafeOrderedDumper,
+    'IndentedSafeOrderedDumper': IndentedSafeOrderedDumper,
+}
+
+
 def get_dumper(dumper_name):
-    return {
-        'OrderedDumper': OrderedDumper,
-        'SafeOrderedDumper': SafeOrderedDumper,
-        'IndentedSafeOrderedDumper': IndentedSafeOrderedDumper,
-    }.get(dumper_name)
+    return _DUMPERS.get(dumper_name)
 
 
 def dump(data, stream=None, **kwargs):
     '''
     .. versionadded:: Oxygen
 
-    Helper that wraps yaml.dump and ensures that we encode unicode strings
-    unless explicitly told not to.
+    Helper that wraps yaml.dump_all (like yaml.dump does) and ensures that
+    we encode unicode strings unless explicitly told not to.
     '''
     if 'allow_unicode' not in kwargs:
         kwargs['allow_unicode'] = True
-    return yaml.dump(data, stream, **kwargs)
+    return yaml.dump_all([data], stream, **kwargs)
 
 
 def safe_dump(data, stream=None, **kwargs):
     '''
     Use a custom dumper to ensure that defaultdict and OrderedDict are
     represented properly. Ensure that unicode strings are encoded unless
-    explicitly told not to.
+    explicitly told not to. Like dump, this wraps yaml.dump_all directly.
     '''
     if 'allow_unicode' not in kwargs:
         kwargs['allow_unicode'] = True
-    return yaml.dump(data, stream, Dumper=SafeOrderedDumper, **kwargs)
+    return yaml.dump_all([data], stream, Dumper=SafeOrderedDumper, **kwargs)
@@ -566,6 +566,20 @@ def salt_information():
     yield 'Salt', __version__
 
 
+def _libyaml_version():
+    '''
+    Return the version of libyaml PyYAML was built against, if any.
+    '''
+    # The libyaml bindings moved from _yaml to yaml._yaml in PyYAML 5.4
+    for modname in ('yaml._yaml', '_yaml'):
+        try:
+            __import__(modname)
+            return sys.modules[modname].get_version_string()
+        except Exception:
+            continue
+    return None
+
+
 def dependency_information(include_salt_cloud=False):
     '''
     Report versions of library dependencies.
@@ -580,6 +594,7 @@ def dependency_information(include_salt_cloud=False):
         ('pycryptodome', 'Cryptodome', 'version_info'),
         ('libnacl', 'libnacl', '__version__'),
         ('PyYAML', 'yaml', '__version__'),
+        ('libyaml', None, _libyaml_version()),
         ('ioflo', 'ioflo', '__version__'),
         ('PyZMQ', 'zmq', '__version__'),
         ('RAET', 'raet', '__version__'),
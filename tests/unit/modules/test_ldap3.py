@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+'''
+    Unit tests for salt.modules.ldap3
+'''
+
+# Import python libs
+from __future__ import absolute_import, print_function, unicode_literals
+import copy
+import pickle
+
+# Import Salt Libs
+import salt.modules.ldap3 as ldap3
+
+# Import Salt Testing Libs
+from tests.support.unit import TestCase
+
+
+class LDAPErrorTestCase(TestCase):
+    '''
+    TestCase for salt.modules.ldap3.LDAPError
+    '''
+
+    def _assert_same_error(self, orig, new):
+        self.assertIsInstance(new, ldap3.LDAPError)
+        self.assertEqual(str(new), str(orig))
+        self.assertEqual(new.cause, orig.cause)
+
+    def test_pickle(self):
+        '''
+        Test that pickling an LDAPError keeps its message and cause
+        '''
+        err = ldap3.LDAPError('exception in ldap backend', 'cause')
+        err.extra = 'value'
+        new = pickle.loads(pickle.dumps(err))
+        self._assert_same_error(err, new)
+        self.assertEqual(new.extra, 'value')
+
+    def test_copy(self):
+        '''
+        Test that copying an LDAPError keeps its message and cause
+        '''
+        err = ldap3.LDAPError('exception in ldap backend', 'cause')
+        self._assert_same_error(err, copy.copy(err))
+        self._assert_same_error(err, copy.deepcopy(err))
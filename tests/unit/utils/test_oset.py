@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+'''
+    Unit tests for salt.utils.oset.OrderedSet
+'''
+
+# Import python libs
+from __future__ import absolute_import, print_function, unicode_literals
+
+# Import Salt Libs
+from salt.utils.oset import OrderedSet
+
+# Import Salt Testing Libs
+from tests.support.unit import TestCase
+
+
+class OrderedSetTestCase(TestCase):
+    '''
+    TestCase for salt.utils.oset module
+    '''
+
+    def test_eq_ordered_set(self):
+        '''
+        Test that comparing two OrderedSets takes the order into account
+        '''
+        self.assertEqual(OrderedSet([1, 2, 3]), OrderedSet([1, 2, 3]))
+        self.assertNotEqual(OrderedSet([1, 2, 3]), OrderedSet([3, 2, 1]))
+
+    def test_eq_set(self):
+        '''
+        Test comparing to a set or frozenset
+        '''
+        oset = OrderedSet([1, 2, 3])
+        for kind in (set, frozenset):
+            # Same members
+            self.assertEqual(oset, kind([3, 2, 1]))
+            # Same size, different members
+            self.assertNotEqual(oset, kind([1, 2, 4]))
+            # Different sizes
+            self.assertNotEqual(oset, kind([1, 2]))
+            self.assertNotEqual(oset, kind([1, 2, 3, 4]))
+
+    def test_eq_iterable(self):
+        '''
+        Test comparing to other iterables, which may hold duplicates
+        '''
+        self.assertEqual(OrderedSet([1, 2]), [2, 1, 1])
+        self.assertNotEqual(OrderedSet([1, 2]), [1, 3])
+        self.assertNotEqual(OrderedSet([1, 2]), None)
+
+    def test_unhashable(self):
+        '''
+        Test that OrderedSet can't be hashed, since it is mutable
+        '''
+        self.assertRaises(TypeError, hash, OrderedSet([1]))
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+'''
+    Unit tests for salt.utils.yamldumper
+'''
+
+# Import python libs
+from __future__ import absolute_import, print_function, unicode_literals
+import imp
+import os
+import sys
+import warnings
+
+# Import 3rd-party libs
+import yaml  # pylint: disable=blacklisted-import
+
+# Import Salt Libs
+import salt.utils.yaml
+import salt.utils.yamldumper
+from salt.ext import six
+from salt.utils.odict import OrderedDict
+
+# Import Salt Testing Libs
+from tests.support.unit import TestCase, skipIf
+from tests.support.mock import patch, NO_MOCK, NO_MOCK_REASON
+
+
+class YamlDumperTestCase(TestCase):
+    '''
+    TestCase for salt.utils.yamldumper module
+    '''
+    data = OrderedDict([
+        ('charlie', 1),
+        ('alpha', OrderedDict([('zulu', 2), ('yankee', None)])),
+        ('bravo', 3),
+    ])
+    expected = 'charlie: 1\nalpha:\n  zulu: 2\n  yankee: null\nbravo: 3\n'
+
+    def test_safe_dump_keeps_order(self):
+        '''
+        Test that safe_dump keeps the insertion order of OrderedDicts
+        '''
+        self.assertEqual(
+            salt.utils.yamldumper.safe_dump(self.data,
+                                            default_flow_style=False),
+            self.expected
+        )
+
+    def test_dump_keeps_order(self):
+        '''
+        Test that the ordered dumpers keep the insertion order of OrderedDicts
+        '''
+        for name in ('OrderedDumper', 'IndentedSafeOrderedDumper'):
+            dumper = salt.utils.yamldumper.get_dumper(name)
+            self.assertEqual(
+                salt.utils.yamldumper.dump(self.data,
+                                           Dumper=dumper,
+                                           default_flow_style=False),
+                self.expected
+            )
+
+    def test_get_dumper(self):
+        '''
+        Test looking up dumpers by name
+        '''
+        self.assertIs(
+            salt.utils.yamldumper.get_dumper('SafeOrderedDumper'),
+            salt.utils.yamldumper.SafeOrderedDumper
+        )
+        self.assertIsNone(salt.utils.yamldumper.get_dumper('Dumper'))
+
+    @skipIf(NO_MOCK, NO_MOCK_REASON)
+    def test_pure_python_fallback(self):
+        '''
+        Test that a PyYAML built without libyaml is reported
+        '''
+        # Load a throwaway copy of the module, so that the real one (and the
+        # names salt.utils.yaml imported from it) are left untouched.
+        name = 'yamldumper_without_libyaml'
+        path = os.path.splitext(salt.utils.yamldumper.__file__)[0] + '.py'
+        self.addCleanup(sys.modules.pop, name, None)
+        with patch.dict(yaml.__dict__):
+            yaml.__dict__.pop('CDumper', None)
+            yaml.__dict__.pop('CSafeDumper', None)
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                yamldumper = imp.load_source(name, path)
+
+        self.assertIs(yamldumper.HAS_LIBYAML, False)
+        self.assertTrue(
+            any(issubclass(x.category, RuntimeWarning) and
+                'libyaml' in six.text_type(x.message) for x in caught)
+        )
+        self.assertTrue(
+            issubclass(yamldumper.SafeOrderedDumper, yaml.SafeDumper)
+        )
+        self.assertIs(salt.utils.yaml.SafeOrderedDumper,
+                      salt.utils.yamldumper.SafeOrderedDumper)